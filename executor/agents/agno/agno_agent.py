@@ -9,7 +9,7 @@
 import asyncio
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 from agno.agent import Agent as AgnoSDKAgent
 from agno.agent import RunEvent
@@ -27,7 +27,6 @@ from shared.telemetry.decorators import add_span_event, trace_async
 
 from .config_utils import ConfigManager
 from .mcp_manager import MCPManager
-from .member_builder import MemberBuilder
 from .model_factory import ModelFactory
 from .team_builder import TeamBuilder
 from .thinking_step_manager import ThinkingStepManager
@@ -92,10 +91,9 @@ class AgnoAgent(Agent):
         # Initialize team builder
         self.team_builder = TeamBuilder(db, self.config_manager, self.thinking_manager)
 
-        # Initialize member builder
-        self.member_builder = MemberBuilder(
-            db, self.config_manager, self.thinking_manager
-        )
+        # Share the team builder's member builder instead of building a second
+        # one, so a single MCPManager tracks the tools of both modes
+        self.member_builder = self.team_builder.member_builder
 
         # debug mode
         self.debug_mode: bool = DEBUG_RUN != ""
@@ -239,14 +237,20 @@ class AgnoAgent(Agent):
 
     async def _create_agent(self) -> Optional[AgnoSDKAgent]:
         """
-        Create a team with configured members
+        Create a single agent from the first member that builds successfully
         """
-        agents = await self.member_builder.create_members_from_config(
-            self.options["team_members"], self.task_data
-        )
-        if len(agents) < 0:
-            return None
-        return agents[0]
+        # Build configs one at a time and stop at the first success, so the
+        # remaining members (and their MCP tools) are only built as fallbacks
+        for member_config in self.options["team_members"]:
+            agent = await self.member_builder.create_member(
+                member_config, self.task_data
+            )
+            if agent:
+                return agent
+            logger.warning(
+                f"Failed to create agent from config, trying next: {member_config.get('name', 'Unnamed')}"
+            )
+        return None
 
     async def _create_team(self) -> Optional[Team]:
         """
@@ -432,7 +436,8 @@ class AgnoAgent(Agent):
                     self._clients[self.session_id] = self.team
                 else:
                     self.single_agent = await self._create_agent()
-                    self._clients[self.session_id] = self.single_agent
+                    if self.single_agent is not None:
+                        self._clients[self.session_id] = self.single_agent
 
             # Checkpoint 2: Check cancellation after team/agent creation
             if self.task_state_manager.is_cancelled(self.task_id):
@@ -563,17 +568,14 @@ class AgnoAgent(Agent):
         return TaskStatus.FAILED
 
     async def _handle_agent_streaming_event(
-        self, run_response_event, result_content: str
-    ) -> str:
+        self, run_response_event, content_parts: List[str]
+    ) -> None:
         """
         Handle agent streaming events
 
         Args:
             run_response_event: The streaming event
-            result_content: Current result content
-
-        Returns:
-            str: Updated result content
+            content_parts: Accumulated content chunks, extended in place
         """
         # Handle agent run events
         if run_response_event.event in [RunEvent.run_started]:
@@ -667,9 +669,7 @@ class AgnoAgent(Agent):
         if run_response_event.event in [RunEvent.run_content]:
             content_chunk = run_response_event.content
             if content_chunk:
-                result_content += str(content_chunk)
-
-        return result_content
+                content_parts.append(str(content_chunk))
 
     def _get_team_config(self) -> Dict[str, Any]:
         """
@@ -760,7 +760,7 @@ class AgnoAgent(Agent):
         """
         try:
             content_started = False
-            result_content = ""
+            content_parts: List[str] = []
             # Update current progress
             self._update_progress(70)
             # Report initial progress
@@ -793,8 +793,8 @@ class AgnoAgent(Agent):
                     logger.info(f"Task {self.task_id} cancelled during agent streaming")
                     return TaskStatus.COMPLETED
 
-                result_content = await self._handle_agent_streaming_event(
-                    run_response_event, result_content
+                await self._handle_agent_streaming_event(
+                    run_response_event, content_parts
                 )
 
             # Check if task was cancelled
@@ -802,7 +802,7 @@ class AgnoAgent(Agent):
                 return TaskStatus.COMPLETED
 
             return self._handle_execution_result(
-                result_content, "agent streaming execution"
+                "".join(content_parts), "agent streaming execution"
             )
 
         except Exception as e:
@@ -880,7 +880,7 @@ class AgnoAgent(Agent):
             ext_config = self._get_team_config()
 
             content_started = False
-            result_content = ""
+            content_parts: List[str] = []
             # Update current progress
             self._update_progress(70)
             # Report initial progress
@@ -912,8 +912,8 @@ class AgnoAgent(Agent):
                     logger.info(f"Task {self.task_id} cancelled during team streaming")
                     return TaskStatus.COMPLETED
 
-                result_content, reasoning = await self._handle_team_streaming_event(
-                    run_response_event, result_content
+                await self._handle_team_streaming_event(
+                    run_response_event, content_parts
                 )
                 # Thinking steps are already handled in _handle_team_streaming_event
                 # Here we only need to report progress, no need to add thinking again
@@ -923,24 +923,24 @@ class AgnoAgent(Agent):
                 return TaskStatus.COMPLETED
 
             return self._handle_execution_result(
-                result_content, "team streaming execution"
+                "".join(content_parts), "team streaming execution"
             )
 
         except Exception as e:
             return self._handle_execution_error(e, "team streaming execution")
 
     async def _handle_team_streaming_event(
-        self, run_response_event, result_content: str
-    ) -> Tuple[str, Optional[Any]]:
+        self, run_response_event, content_parts: List[str]
+    ) -> Optional[Any]:
         """
         Handle team streaming events
 
         Args:
             run_response_event: The streaming event
-            result_content: Current result content
+            content_parts: Accumulated content chunks, extended in place
 
         Returns:
-            str: Updated result content
+            Optional[Any]: Team reasoning content carried by the event, if any
         """
         reasoning = None
 
@@ -1147,9 +1147,9 @@ class AgnoAgent(Agent):
         if run_response_event.event in [TeamRunEvent.run_content]:
             content_chunk = run_response_event.content
             if content_chunk:
-                result_content += str(content_chunk)
+                content_parts.append(str(content_chunk))
 
-        return result_content, reasoning
+        return reasoning
 
     @classmethod
     async def close_client(cls, session_id: str) -> TaskStatus:
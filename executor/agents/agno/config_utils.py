@@ -15,6 +15,23 @@ from shared.utils.sensitive_data_masker import mask_sensitive_data
 
 logger = setup_logger("agno_config_utils")
 
+# Pattern to match placeholders in format ${source_spec}
+_PLACEHOLDER_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Valid options for Agno, copied from the bot config when set
+_VALID_AGNO_OPTIONS = (
+    "model",
+    "model_id",
+    "api_key",
+    "system_prompt",
+    "tools",
+    "mcp_servers",
+    "mcpServers",
+    "team_members",
+    "team_description",
+    "stream",
+)
+
 
 def resolve_value_from_source(data_sources: Dict[str, Dict[str, Any]], source_spec: str) -> str:
     """
@@ -73,9 +90,6 @@ def replace_placeholders_with_sources(template: str, data_sources: Dict[str, Dic
     Returns:
         The template with placeholders replaced with actual values
     """
-    # Find all placeholders in format ${source_spec}
-    pattern = r'\$\{([^}]+)\}'
-
     logger.info(f"data_sources:{data_sources}, template:{template}")
 
     def replace_match(match):
@@ -83,7 +97,7 @@ def replace_placeholders_with_sources(template: str, data_sources: Dict[str, Dic
         value = resolve_value_from_source(data_sources, source_spec)
         return value
 
-    return re.sub(pattern, replace_match, template)
+    return _PLACEHOLDER_RE.sub(replace_match, template)
 
 
 class ConfigManager:
@@ -198,50 +212,25 @@ class ConfigManager:
         Returns:
             Dict containing valid Agno options
         """
-        # List of valid options for Agno
-        valid_options = [
-            "model",
-            "model_id",
-            "api_key",
-            "system_prompt",
-            "tools",
-            "mcp_servers",
-            "mcpServers",
-            "team_members",
-            "team_description",
-            "stream",
-        ]
-
         # Collect all non-None configuration parameters
         options = {}
         bot_config = task_data.get("bot", {})
 
-        # Extract all non-None parameters from bot_config
-        if bot_config:
-            for key in valid_options:
-                if key in bot_config and bot_config[key] is not None:
-                    options[key] = bot_config[key]
-
         # Handle both single bot object and bot array
         if bot_config:
             if isinstance(bot_config, list):
                 # Handle bot array - use the first bot configuration
                 team_members = []
                 for tmp_bot in bot_config:
-                    tmp_bot_options = {}
                     logger.info(
                         f"Found bot array with {len(bot_config)} bots, using bot: {tmp_bot.get('name', 'unnamed')}")
-                    # Extract all non-None parameters from the first bot
-                    for key in valid_options:
-                        if key in tmp_bot and tmp_bot[key] is not None:
-                            tmp_bot_options[key] = tmp_bot[key]
                     team_members.append(tmp_bot)
 
                 options["team_members"] = team_members
             else:
                 # Handle single bot object (original logic)
                 logger.info("Found single bot configuration")
-                for key in valid_options:
+                for key in _VALID_AGNO_OPTIONS:
                     if key in bot_config and bot_config[key] is not None:
                         options[key] = bot_config[key]
 
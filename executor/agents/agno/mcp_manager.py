@@ -24,6 +24,9 @@ from shared.logger import setup_logger
 
 logger = setup_logger("agno_mcp_manager")
 
+# Accepted spellings of the streamable HTTP transport type
+_STREAMABLE_HTTP_TYPES = frozenset({"streamable-http", "streamable_http"})
+
 
 class MCPManager:
     """
@@ -81,7 +84,9 @@ class MCPManager:
 
             if mcp_tools_list:
                 logger.info("Setting up MCP tools")
-                # Connect all MCP tools in the list
+                # Connect all MCP tools in the list. Each transport enters an
+                # anyio task group that must be exited from the same task, so
+                # connect here in the calling task rather than in gather children
                 for mcp_tool in mcp_tools_list:
                     logger.info(f"Connecting to MCP server: {mcp_tool}")
                     await mcp_tool.connect()
@@ -119,7 +124,7 @@ class MCPManager:
             if not mcp_type:
                 mcp_type = "stdio"
 
-            if mcp_type == "streamable-http" or mcp_type == "streamable_http":
+            if mcp_type in _STREAMABLE_HTTP_TYPES:
                 return self._create_streamable_http_tools(server_config)
             elif mcp_type == "sse":
                 return self._create_sse_tools(server_config)
@@ -309,7 +314,7 @@ class MCPManager:
                     title_key="thinking.mcp_init_fail",
                     report_immediately=False,
                     details={
-                        "error_message": f"Failed to disconnect MCP tools. \nerror message: {str(e)}. \ntools: {json.dumps(tools, ensure_ascii=False)}"
+                        "error_message": f"Failed to disconnect MCP tools. \nerror message: {str(e)}. \ntools: {json.dumps(tools, ensure_ascii=False, default=str)}"
                     },
                 )
 
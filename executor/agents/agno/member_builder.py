@@ -53,7 +53,9 @@ class MemberBuilder:
             Team member instance or None if creation fails
         """
         try:
-            logger.info(f"Creating team member: {member_config.get('name', 'Unnamed')}")
+            logger.info(
+                "Creating team member: %s", member_config.get("name", "Unnamed")
+            )
 
             # Setup MCP tools if available (pass task_data for variable replacement)
             mcp_tools = await self.mcp_manager.setup_mcp_tools(member_config, task_data)
@@ -94,11 +96,11 @@ class MemberBuilder:
                 telemetry=False,
             )
 
-            logger.info(f"Successfully created team member: {member_name}")
+            logger.info("Successfully created team member: %s", member_name)
             return member
 
         except Exception as e:
-            logger.error(f"Failed to create team member: {str(e)}")
+            logger.error("Failed to create team member: %s", e)
             return None
 
     async def create_default_member(
@@ -154,7 +156,7 @@ class MemberBuilder:
             return member
 
         except Exception as e:
-            logger.error(f"Failed to create default team member: {str(e)}")
+            logger.error("Failed to create default team member: %s", e)
             return None
 
     async def create_members_from_config(
@@ -176,14 +178,16 @@ class MemberBuilder:
             logger.warning("No team members configuration provided")
             return members
 
+        # Sequential on purpose: create_member connects MCP tools, whose anyio
+        # task groups must be entered and exited from the same task
         for member_config in team_members_config:
             member = await self.create_member(member_config, task_data)
             if member:
                 members.append(member)
             else:
-                logger.warning(f"Failed to create member from config: {member_config}")
+                logger.warning("Failed to create member from config: %s", member_config)
 
-        logger.info(f"Created {len(members)} team members from configuration")
+        logger.info("Created %d team members from configuration", len(members))
         return members
 
     async def create_member_with_role(
@@ -209,12 +213,12 @@ class MemberBuilder:
             member = await self.create_member(member_config_with_role, task_data)
 
             if member:
-                logger.info(f"Created team member with role '{role}': {member.name}")
+                logger.info("Created team member with role '%s': %s", role, member.name)
 
             return member
 
         except Exception as e:
-            logger.error(f"Failed to create team member with role '{role}': {str(e)}")
+            logger.error("Failed to create team member with role '%s': %s", role, e)
             return None
 
     def _get_member_name(self, member_config: Dict[str, Any]) -> str:
@@ -271,16 +275,16 @@ class MemberBuilder:
             member: Team member instance to clean up
         """
         try:
-            logger.info(f"Cleaning up resources for member: {member.name}")
+            logger.info("Cleaning up resources for member: %s", member.name)
 
             # Clean up MCP tools if any
             await self.mcp_manager.cleanup_tools()
 
-            logger.info(f"Successfully cleaned up resources for member: {member.name}")
+            logger.info("Successfully cleaned up resources for member: %s", member.name)
 
         except Exception as e:
             logger.error(
-                f"Failed to clean up resources for member {member.name}: {str(e)}"
+                "Failed to clean up resources for member %s: %s", member.name, e
             )
 
     async def cleanup_all_resources(self) -> None:
@@ -296,4 +300,4 @@ class MemberBuilder:
             logger.info("Successfully cleaned up all member builder resources")
 
         except Exception as e:
-            logger.error(f"Failed to clean up member builder resources: {str(e)}")
+            logger.error("Failed to clean up member builder resources: %s", e)
@@ -6,7 +6,8 @@
 
 # -*- coding: utf-8 -*-
 
-from typing import Dict, Any, List, Optional, Union, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Union, Tuple
 from agno.agent import Agent as AgnoSdkAgent
 from agno.team import Team
 from agno.db.sqlite import SqliteDb
@@ -20,6 +21,32 @@ from .member_builder import MemberBuilder
 
 logger = setup_logger("agno_team_builder")
 
+# Team keyword arguments per collaboration mode, shared read-only across calls
+# Coordination: Leader splits tasks → selective assignment → summary
+_COORDINATE_MODE_CONFIG = MappingProxyType({
+    "reasoning": True,
+})
+# Collaboration: All members work in parallel, leader summarizes
+_COLLABORATE_MODE_CONFIG = MappingProxyType({
+    "delegate_task_to_all_members": True,
+    "reasoning": True,
+})
+# Routing: Select only the most suitable member
+_ROUTE_MODE_CONFIG = MappingProxyType({
+    "respond_directly": True,
+})
+# Default to coordination mode for stability
+_DEFAULT_MODE_CONFIG = MappingProxyType({
+    "delegate_task_to_all_members": False,
+    "respond_directly": False,
+    "determine_input_for_members": False,
+})
+_MODE_CONFIGS = {
+    "coordinate": _COORDINATE_MODE_CONFIG,
+    "collaborate": _COLLABORATE_MODE_CONFIG,
+    "route": _ROUTE_MODE_CONFIG,
+}
+
 
 class TeamBuilder:
     """
@@ -54,31 +81,38 @@ class TeamBuilder:
             Configured Team instance
         """
         logger.info("Starting to build team")
-        
+
+        # Bail out before building (and connecting MCP tools for) members we
+        # would discard
+        if not self._can_form_team(options):
+            logger.info("create_team skipped. fewer than two team members configured")
+            return None
+
         # Create team members based on configuration
         team_data = await self._create_team_members(options, task_data)
         team_leader = team_data["leader"]
         team_members = team_data["members"]
+        member_count = len(team_members)
 
         # It is believed that the agent mode needs to be used for operation
-        if ((team_leader is None and len(team_members) == 1)
-                or (team_leader and len(team_members) == 0)):
+        if ((team_leader is None and member_count == 1)
+                or (team_leader and member_count == 0)):
             logger.info("create_team fail. team_leader is None and len(team_members) == 1")
             return None
         
         # Combine leader and members for the team
-        all_team_members = []
-        all_team_members.extend(team_members)
+        all_team_members = list(team_members)
 
         # Get mode configuration
         mode_config = self._get_mode_config(mode)
         if team_leader is None:
             team_leader = all_team_members[0]
         logger.info(
-            f"Creating team with {len(all_team_members)} members (leader: {'Yes' if team_leader else 'No'}, other_members: {len(team_members)}), mode: {mode}, "
+            "Creating team with %d members (leader: %s, other_members: %d), mode: %s, ",
+            member_count, "Yes" if team_leader else "No", member_count, mode,
         )
 
-        logger.info(f"team_leader.description: {team_leader.description}")
+        logger.info("team_leader.description: %s", team_leader.description)
 
         # Create team
         # agent session: https://docs.agno.com/concepts/agents/sessions
@@ -102,6 +136,21 @@ class TeamBuilder:
 
         return team
     
+    @staticmethod
+    def _can_form_team(options: Dict[str, Any]) -> bool:
+        """
+        Check whether the options configure enough members to form a team
+
+        Args:
+            options: Team configuration options
+
+        Returns:
+            True if at least two team members are configured, False otherwise
+        """
+        # Fewer than two configured bots can never form a team
+        team_members_config = options.get("team_members")
+        return isinstance(team_members_config, list) and len(team_members_config) >= 2
+    
     async def _create_team_members(self, options: Dict[str, Any], task_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create team members based on configuration, separating team leader from other members
@@ -117,45 +166,29 @@ class TeamBuilder:
         """
         team_members = []
         team_leader = None
-        team_members_config = options.get("team_members")
-        
-        if team_members_config:
-            if isinstance(team_members_config, list):
-                # Multiple team members
-                for member_config in team_members_config:
-                    member = await self.member_builder.create_member(member_config, task_data)
-                    if member:
-                        # Check if this member is a team leader
-                        if member_config.get("role") == "leader":
-                            if team_leader is None:
-                                team_leader = member
-                                logger.info(f"Found team leader: {member.name}")
-                            else:
-                                logger.warning(f"Multiple team leaders found. Using first one, ignoring: {member.name}")
-                        else:
-                            team_members.append(member)
-            else:
-                # Single team member
-                member = await self.member_builder.create_member(team_members_config, task_data)
-                if member:
-                    # Check if this member is a team leader
-                    if team_members_config.get("role") == "leader":
+        # create_team only gets here once _can_form_team has confirmed a list of
+        # at least two member configs, so there is no single or default member case
+        team_members_config = options["team_members"]
+
+        # Multiple team members, built one by one: create_member connects
+        # MCP tools, whose anyio task groups must stay in this task
+        for member_config in team_members_config:
+            member = await self.member_builder.create_member(member_config, task_data)
+            if member:
+                # Check if this member is a team leader
+                if member_config.get("role") == "leader":
+                    if team_leader is None:
                         team_leader = member
-                        logger.info(f"Found team leader: {member.name}")
+                        logger.info("Found team leader: %s", member.name)
                     else:
-                        team_members.append(member)
-        else:
-            # Default team member
-            member = await self.member_builder.create_default_member(options, task_data)
-            if member:
-                # Check if default member is a team leader
-                if options.get("role") == "leader":
-                    team_leader = member
-                    logger.info(f"Found team leader (default): {member.name}")
+                        logger.warning("Multiple team leaders found. Using first one, ignoring: %s", member.name)
                 else:
                     team_members.append(member)
         
-        logger.info(f"Team creation completed: leader={'Yes' if team_leader else 'No'}, other_members={len(team_members)}")
+        logger.info(
+            "Team creation completed: leader=%s, other_members=%d",
+            "Yes" if team_leader else "No", len(team_members),
+        )
         
         return {
             "leader": team_leader,
@@ -175,7 +208,7 @@ class TeamBuilder:
         """
         return await self.member_builder.create_member(member_config, task_data)
     
-    def _get_mode_config(self, mode: str) -> Dict[str, Any]:
+    def _get_mode_config(self, mode: str) -> Mapping[str, Any]:
         """
         Get mode configuration based on team mode
         
@@ -183,35 +216,15 @@ class TeamBuilder:
             mode: Team mode (coordinate, collaborate, route)
             
         Returns:
-            Mode configuration dictionary
+            Read-only mode configuration mapping
         """
-        if mode == "coordinate":
-            # Coordination: Leader splits tasks → selective assignment → summary
-            return {
-                "reasoning": True,
-            }
-        elif mode == "collaborate":
-            # Collaboration: All members work in parallel, leader summarizes
-            return {
-                "delegate_task_to_all_members": True,
-                "reasoning": True,
-            }
-        elif mode == "route":
-            # Routing: Select only the most suitable member
-            return {
-                "respond_directly": True
-            }
-        else:
-            # Default to coordination mode for stability
-            return {
-                "delegate_task_to_all_members": False,
-                "respond_directly": False,
-                "determine_input_for_members": False,
-            }
+        return _MODE_CONFIGS.get(mode, _DEFAULT_MODE_CONFIG)
     
     async def cleanup(self) -> None:
         """
         Clean up resources used by the team builder
         """
+        # Sequential, in the caller's task: MCP transports must be exited from
+        # the task that entered them, so the two cleanups cannot be gathered
         await self.mcp_manager.cleanup_tools()
         await self.member_builder.cleanup_all_resources()
\ No newline at end of file
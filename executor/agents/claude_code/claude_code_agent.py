@@ -51,6 +51,48 @@ def _extract_claude_agent_attributes(self, *args, **kwargs) -> Dict[str, Any]:
     }
 
 
+# Static part of ~/.claude.json; only userID is generated per initialization
+_CLAUDE_JSON_CONFIG: Dict[str, Any] = {
+    "numStartups": 2,
+    "installMethod": "unknown",
+    "autoUpdates": True,
+    "sonnet45MigrationComplete": True,
+    "hasCompletedOnboarding": True,
+    "lastOnboardingVersion": "2.0.14",
+    "bypassPermissionsModeAccepted": True,
+    "hasOpusPlanDefault": False,
+    "lastReleaseNotesSeen": "2.0.14",
+    "isQualifiedForDataSharing": False,
+}
+
+
+# Valid options for ClaudeAgentOptions, copied from the bot config when set
+_VALID_CLAUDE_OPTIONS = (
+    "allowed_tools",
+    "max_thinking_tokens",
+    "system_prompt",
+    "mcp_tools",
+    "mcp_servers",
+    "mcpServers",
+    "permission_mode",
+    "continue_conversation",
+    "resume",
+    "max_turns",
+    "disallowed_tools",
+    "model",
+    "permission_prompt_tool_name",
+    "cwd",
+)
+
+# Claude Code settings sources loaded for every client
+_SETTING_SOURCES = ("user", "project", "local")
+
+# Bot env keys already mapped to Claude Code settings by _create_claude_model
+_EXCLUDED_ENV_KEYS = frozenset(
+    {"model_id", "api_key", "base_url", "model", "small_model"}
+)
+
+
 def _generate_claude_code_user_id() -> str:
     return "".join(random.choices(string.ascii_lowercase + string.digits, k=64))
 
@@ -65,6 +107,8 @@ class ClaudeCodeAgent(Agent):
 
     # Static dictionary for storing hook functions
     _hooks: Dict[str, Any] = {}
+    # Whether hook configuration has been looked up, even if nothing was loaded
+    _hooks_loaded: bool = False
 
     def get_name(self) -> str:
         return "ClaudeCode"
@@ -76,9 +120,10 @@ class ClaudeCodeAgent(Agent):
         This method loads hooks from /app/config/claude_hooks.json if it exists.
         Hooks are loaded once and stored in the class variable _hooks.
         """
-        if cls._hooks:
-            # Hooks already loaded
+        if cls._hooks_loaded:
+            # Hooks already loaded (or no hook configuration exists)
             return
+        cls._hooks_loaded = True
 
         hook_config_path = Path("/app/config/claude_hooks.json")
         if not hook_config_path.exists():
@@ -127,6 +172,9 @@ class ClaudeCodeAgent(Agent):
         self.prompt = task_data.get("prompt", "")
         self.project_path = None
 
+        # Event loop that owns the SDK client, recorded when execution starts
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Load hooks on first initialization
         self._load_hooks()
 
@@ -479,17 +527,8 @@ class ClaudeCodeAgent(Agent):
                     # Save claude.json config
                     claude_json_path = os.path.expanduser("~/.claude.json")
                     claude_json_config = {
-                        "numStartups": 2,
-                        "installMethod": "unknown",
-                        "autoUpdates": True,
-                        "sonnet45MigrationComplete": True,
+                        **_CLAUDE_JSON_CONFIG,
                         "userID": _generate_claude_code_user_id(),
-                        "hasCompletedOnboarding": True,
-                        "lastOnboardingVersion": "2.0.14",
-                        "bypassPermissionsModeAccepted": True,
-                        "hasOpusPlanDefault": False,
-                        "lastReleaseNotesSeen": "2.0.14",
-                        "isQualifiedForDataSharing": False,
                     }
                     with open(claude_json_path, "w") as f:
                         json.dump(claude_json_config, f, indent=2)
@@ -538,9 +577,8 @@ class ClaudeCodeAgent(Agent):
             env_config["ANTHROPIC_BASE_URL"] = base_url.removesuffix("/v1")
 
         # Add other environment variables except model_id, api_key, base_url
-        excluded_keys = {"model_id", "api_key", "base_url", "model", "small_model"}
         for key, value in env.items():
-            if key not in excluded_keys and value is not None:
+            if key not in _EXCLUDED_ENV_KEYS and value is not None:
                 env_config[key] = value
 
         # Apply post-creation hook if available
@@ -582,30 +620,13 @@ class ClaudeCodeAgent(Agent):
         Returns:
             Dict containing valid Claude Code options
         """
-        # List of valid options for ClaudeAgentOptions
-        valid_options = [
-            "allowed_tools",
-            "max_thinking_tokens",
-            "system_prompt",
-            "mcp_tools",
-            "mcp_servers",
-            "mcpServers",
-            "permission_mode",
-            "continue_conversation",
-            "resume",
-            "max_turns",
-            "disallowed_tools",
-            "model",
-            "permission_prompt_tool_name",
-            "cwd",
-        ]
-
         logger.info(
             f"Extracting Claude options from task data: {mask_sensitive_data(task_data)}"
         )
 
         # Collect all non-None configuration parameters
-        options = {"setting_sources": ["user", "project", "local"]}
+        # Fresh list per call, the options are handed to the SDK and stored per client
+        options = {"setting_sources": list(_SETTING_SOURCES)}
         bots = task_data.get("bot", [])
         bot_config = bots[0]
         # Extract all non-None parameters from bot_config
@@ -618,7 +639,7 @@ class ClaudeCodeAgent(Agent):
                 logger.info(f"Detected MCP servers configuration: {mcp_servers}")
                 bot_config["mcp_servers"] = mcp_servers
 
-            for key in valid_options:
+            for key in _VALID_CLAUDE_OPTIONS:
                 if key in bot_config and bot_config[key] is not None:
                     options[key] = bot_config[key]
 
@@ -791,6 +812,9 @@ class ClaudeCodeAgent(Agent):
             TaskStatus: Execution status
         """
         try:
+            # Remember the loop the client lives on so cancel_run can reach it
+            self._loop = asyncio.get_running_loop()
+
             # Check if task was cancelled before execution
             if self.task_state_manager.is_cancelled(self.task_id):
                 logger.info(f"Task {self.task_id} was cancelled before execution")
@@ -851,10 +875,7 @@ class ClaudeCodeAgent(Agent):
                     f"Initializing Claude client with options: {mask_sensitive_data(self.options)}"
                 )
 
-                if self.options.get("cwd") is None or self.options.get("cwd") == "":
-                    cwd = os.path.join(config.WORKSPACE_ROOT, str(self.task_id))
-                    os.makedirs(cwd, exist_ok=True)
-                    self.options["cwd"] = cwd
+                self._resolve_cwd()
 
                 if self.options:
                     code_options = ClaudeAgentOptions(**self.options)
@@ -882,11 +903,12 @@ class ClaudeCodeAgent(Agent):
 
             # Prepare prompt
             prompt = self.prompt
-            if self.options.get("cwd"):
+            cwd = self.options.get("cwd")
+            if cwd:
                 prompt = (
                     prompt
                     + "\nCurrent working directory: "
-                    + self.options.get("cwd")
+                    + cwd
                     + "\n project url:"
                     + self.task_data.get("git_url")
                 )
@@ -929,6 +951,17 @@ class ClaudeCodeAgent(Agent):
         except Exception as e:
             return self._handle_execution_error(e, "async execution")
 
+    def _resolve_cwd(self) -> None:
+        """
+        Resolve the working directory for the Claude client.
+        Falls back to the task workspace, which is created once and then
+        cached in options so later executions skip the filesystem calls.
+        """
+        if not self.options.get("cwd"):
+            cwd = os.path.join(config.WORKSPACE_ROOT, str(self.task_id))
+            os.makedirs(cwd, exist_ok=True)
+            self.options["cwd"] = cwd
+
     def _handle_execution_result(
         self, result_content: str, execution_type: str = "execution"
     ) -> TaskStatus:
@@ -1111,30 +1144,28 @@ class ClaudeCodeAgent(Agent):
                 # Check if we're in an async context
                 try:
                     loop = asyncio.get_running_loop()
-                    # If we're in an async context, create a task
-                    asyncio.create_task(self._async_cancel_run())
                 except RuntimeError:
-                    # No running event loop, run the async method in a new loop
-                    # Copy ContextVars before creating new event loop
-                    try:
-                        from shared.telemetry.context import (
-                            copy_context_vars,
-                            restore_context_vars,
-                        )
-
-                        saved_context = copy_context_vars()
-                    except ImportError:
-                        saved_context = None
+                    loop = None
 
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        # Restore ContextVars in the new event loop
-                        if saved_context:
-                            restore_context_vars(saved_context)
-                        loop.run_until_complete(self._async_cancel_run())
-                    finally:
-                        loop.close()
+                if (
+                    self._loop is not None
+                    and self._loop is not loop
+                    and self._loop.is_running()
+                ):
+                    # The client belongs to another running loop (e.g. cancel
+                    # comes from the API server's loop while the task runs on its
+                    # own), so send the interrupt to the loop that owns it
+                    asyncio.run_coroutine_threadsafe(
+                        self._async_cancel_run(), self._loop
+                    )
+                elif loop is not None:
+                    # Already on the owning loop, create a task
+                    loop.create_task(self._async_cancel_run())
+                else:
+                    # No running loop, run the async method to completion here.
+                    # asyncio.run copies the current context into its task, so
+                    # ContextVars carry over without saving and restoring them
+                    asyncio.run(self._async_cancel_run())
         except Exception as e:
             logger.exception(
                 f"Error during sync interrupt for session_id {self.session_id}: {str(e)}"
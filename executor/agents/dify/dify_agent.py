@@ -7,6 +7,7 @@
 # -*- coding: utf-8 -*-
 
 import json
+import re
 import requests
 from typing import Dict, Any, Optional
 import time
@@ -22,6 +23,11 @@ from executor.config import config
 
 logger = setup_logger("dify_agent")
 
+# Pattern to match [EXTERNAL_API_PARAMS]...json...[/EXTERNAL_API_PARAMS]
+_EXTERNAL_API_PARAMS_RE = re.compile(
+    r'\[EXTERNAL_API_PARAMS\](.*?)\[/EXTERNAL_API_PARAMS\]', re.DOTALL
+)
+
 
 class DifyAgent(Agent):
     """
@@ -160,11 +166,7 @@ class DifyAgent(Agent):
         Returns:
             Tuple of (cleaned_prompt, params_dict)
         """
-        import re
-
-        # Pattern to match [EXTERNAL_API_PARAMS]...json...[/EXTERNAL_API_PARAMS]
-        pattern = r'\[EXTERNAL_API_PARAMS\](.*?)\[/EXTERNAL_API_PARAMS\]'
-        match = re.search(pattern, prompt, re.DOTALL)
+        match = _EXTERNAL_API_PARAMS_RE.search(prompt)
 
         if not match:
             return prompt, {}
@@ -175,7 +177,7 @@ class DifyAgent(Agent):
             params = json.loads(params_json)
 
             # Remove the marker block from prompt
-            cleaned_prompt = re.sub(pattern, '', prompt, flags=re.DOTALL).strip()
+            cleaned_prompt = _EXTERNAL_API_PARAMS_RE.sub('', prompt).strip()
 
             logger.info(f"Extracted external API params from prompt: {params}")
             return cleaned_prompt, params
@@ -35,6 +35,28 @@ class AgentFactory:
         "imagevalidator": ImageValidatorAgent,
     }
 
+    # Classifications are static, so resolve them once at import time
+    # Older agents without AGENT_TYPE default to local_engine
+    _agent_types = {
+        name: getattr(agent_class, "AGENT_TYPE", "local_engine")
+        for name, agent_class in _agents.items()
+    }
+    _external_api_types = frozenset(
+        name for name, type_ in _agent_types.items() if type_ == "external_api"
+    )
+
+    @classmethod
+    def _normalize_type(cls, agent_type: str) -> str:
+        """
+        Normalize agent_type to a registry key
+
+        Registry keys are lowercase, so the common already-lowercase case is
+        returned as is without allocating a new string.
+        """
+        if agent_type in cls._agents:
+            return agent_type
+        return agent_type.lower()
+
     @classmethod
     def get_agent(cls, agent_type: str, task_data: Dict[str, Any]) -> Optional[Agent]:
         """
@@ -47,11 +69,11 @@ class AgentFactory:
         Returns:
             An instance of the requested agent, or None if the agent_type is not supported
         """
-        agent_class = cls._agents.get(agent_type.lower())
+        agent_class = cls._agents.get(cls._normalize_type(agent_type))
         if agent_class:
             return agent_class(task_data)
         else:
-            logger.error(f"Unsupported agent type: {agent_type}")
+            logger.error("Unsupported agent type: %s", agent_type)
             return None
 
     @classmethod
@@ -65,10 +87,7 @@ class AgentFactory:
         Returns:
             True if the agent is an external API type, False otherwise
         """
-        agent_class = cls._agents.get(agent_type.lower())
-        if agent_class and hasattr(agent_class, 'AGENT_TYPE'):
-            return agent_class.AGENT_TYPE == "external_api"
-        return False
+        return cls._normalize_type(agent_type) in cls._external_api_types
 
     @classmethod
     def get_agent_type(cls, agent_type: str) -> Optional[str]:
@@ -81,9 +100,4 @@ class AgentFactory:
         Returns:
             "local_engine", "external_api", or None if agent type not found
         """
-        agent_class = cls._agents.get(agent_type.lower())
-        if agent_class:
-            if hasattr(agent_class, 'AGENT_TYPE'):
-                return agent_class.AGENT_TYPE
-            return "local_engine"  # Default for older agents without AGENT_TYPE
-        return None
+        return cls._agent_types.get(cls._normalize_type(agent_type))
@@ -25,7 +25,7 @@ def _format_task_log(task_id, subtask_id):
     return f"task_id: {task_id}.{subtask_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSession:
     agent: Agent
     created_at: float
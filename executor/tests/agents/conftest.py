@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(scope="package", autouse=True)
+def stub_callback_post():
+    """
+    Stub the callback HTTP POST once for the agents test package.
+    Package-scoped so the shared requests module is restored once it finishes.
+    CallbackClient.send_callback() would otherwise make real requests to the callback URL.
+    """
+
+    def _post(*args, **kwargs):
+        return SimpleNamespace(
+            status_code=200, text="{}", content=b"{}", json=lambda: {}
+        )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("executor.callback.callback_client.requests.post", _post)
+        yield
+
+
+@pytest.fixture(scope="package", autouse=True)
+def stub_dify_app_mode_get():
+    """
+    Stub the Dify HTTP GET once for the agents test package.
+    DifyAgent.__init__ calls _get_app_mode(), which would otherwise GET /v1/info.
+    """
+
+    def _get(*args, **kwargs):
+        return SimpleNamespace(
+            status_code=200,
+            raise_for_status=lambda: None,
+            json=lambda: {"mode": "chat"},
+        )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("executor.agents.dify.dify_agent.requests.get", _get)
+        yield
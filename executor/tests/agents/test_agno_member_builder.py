@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from executor.agents.agno.member_builder import MemberBuilder
+
+
+class TestMemberBuilder:
+    """Test cases for Agno MemberBuilder"""
+
+    @pytest.fixture
+    def member_builder(self):
+        """MemberBuilder with database and configuration stubbed out"""
+        return MemberBuilder(MagicMock(), MagicMock())
+
+    async def test_create_members_from_config_preserves_order(self, member_builder):
+        """Test members are returned in configuration order"""
+        configs = [{"name": "first"}, {"name": "second"}, {"name": "third"}]
+
+        async def create_member(member_config, task_data):
+            return SimpleNamespace(name=member_config["name"])
+
+        with patch.object(member_builder, "create_member", side_effect=create_member):
+            members = await member_builder.create_members_from_config(configs, {})
+
+        assert [member.name for member in members] == ["first", "second", "third"]
+
+    async def test_create_members_from_config_skips_failed_members(
+        self, member_builder
+    ):
+        """Test members that fail to build are left out"""
+        configs = [{"name": "first"}, {"name": "broken"}, {"name": "third"}]
+
+        async def create_member(member_config, task_data):
+            if member_config["name"] == "broken":
+                return None
+            return SimpleNamespace(name=member_config["name"])
+
+        with patch.object(member_builder, "create_member", side_effect=create_member):
+            members = await member_builder.create_members_from_config(configs, {})
+
+        assert [member.name for member in members] == ["first", "third"]
+
+    async def test_create_members_from_config_builds_one_at_a_time(
+        self, member_builder
+    ):
+        """Test members are built sequentially in the calling task"""
+        configs = [{"name": "first"}, {"name": "second"}, {"name": "third"}]
+        caller_task = asyncio.current_task()
+        in_flight = 0
+        max_in_flight = 0
+        member_tasks = []
+
+        async def create_member(member_config, task_data):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            member_tasks.append(asyncio.current_task())
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return SimpleNamespace(name=member_config["name"])
+
+        with patch.object(member_builder, "create_member", side_effect=create_member):
+            await member_builder.create_members_from_config(configs, {})
+
+        # MCP transports must be connected and disconnected from the same task
+        assert max_in_flight == 1
+        assert member_tasks == [caller_task] * len(configs)
+
+    async def test_create_members_from_config_empty(self, member_builder):
+        """Test empty configuration creates no members"""
+        with patch.object(
+            member_builder, "create_member", new_callable=AsyncMock
+        ) as mock_create_member:
+            members = await member_builder.create_members_from_config([], {})
+
+        assert members == []
+        mock_create_member.assert_not_called()
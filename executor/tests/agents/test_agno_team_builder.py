@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from executor.agents.agno.team_builder import TeamBuilder
+
+
+class TestTeamBuilder:
+    """Test cases for Agno TeamBuilder"""
+
+    @pytest.mark.parametrize(
+        "options,expected",
+        [
+            ({"team_members": [{"name": "a"}, {"name": "b"}]}, True),
+            ({"team_members": [{"name": "a"}]}, False),
+            ({"team_members": {"name": "a"}}, False),
+            ({}, False),
+        ],
+    )
+    def test_can_form_team(self, options, expected):
+        """Test a team needs a list of at least two member configs"""
+        assert TeamBuilder._can_form_team(options) is expected
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"team_members": [{"name": "a"}]},
+            {"team_members": {"name": "a"}},
+            {},
+        ],
+    )
+    async def test_create_team_skips_member_creation(self, options):
+        """Test create_team returns early without building any member"""
+        team_builder = TeamBuilder(MagicMock(), MagicMock())
+
+        with patch.object(
+            team_builder.member_builder, "create_member", new_callable=AsyncMock
+        ) as mock_create_member:
+            team = await team_builder.create_team(
+                options, "coordinate", "session-1", {}
+            )
+
+        assert team is None
+        mock_create_member.assert_not_called()
@@ -9,63 +9,48 @@ from executor.agents.dify.dify_agent import DifyAgent
 from shared.status import TaskStatus
 
 
+def _sample_task_data():
+    """Build a fresh copy of the sample task data"""
+    return {
+        "task_id": 123,
+        "subtask_id": 456,
+        "task_title": "Test Task",
+        "subtask_title": "Test Subtask",
+        "prompt": "Hello Dify",
+        "bot_prompt": json.dumps({
+            "difyAppId": "app-test-123",
+            "params": {
+                "customer_name": "John Doe",
+                "language": "en-US"
+            }
+        }),
+        "bot": [{
+            "agent_config": {
+                "env": {
+                    "DIFY_API_KEY": "app-test-api-key",
+                    "DIFY_BASE_URL": "https://api.dify.ai",
+                    "DIFY_APP_ID": "app-default-123"
+                }
+            }
+        }],
+        "user": {
+            "user_name": "testuser"
+        }
+    }
+
+
 class TestDifyAgent:
     """Test cases for DifyAgent"""
 
-    @pytest.fixture(autouse=True)
-    def mock_http_requests(self):
-        """
-        Mock all HTTP requests to prevent actual network calls during tests.
-        - requests.get: DifyAgent.__init__ calls _get_app_mode() which makes GET to /v1/info
-        - requests.post: CallbackClient.send_callback() makes POST to callback URL
-        Without these mocks, tests would make real HTTP requests causing long timeouts.
-        """
-        with patch('executor.agents.dify.dify_agent.requests.get') as mock_get, \
-             patch('executor.callback.callback_client.requests.post') as mock_post:
-            # Mock GET response for _get_app_mode()
-            mock_get_response = MagicMock()
-            mock_get_response.status_code = 200
-            mock_get_response.json.return_value = {"mode": "chat"}
-            mock_get.return_value = mock_get_response
-
-            # Mock POST response for callback
-            mock_post_response = MagicMock()
-            mock_post_response.status_code = 200
-            mock_post_response.content = b'{}'
-            mock_post_response.json.return_value = {}
-            mock_post.return_value = mock_post_response
-
-            yield {"get": mock_get, "post": mock_post}
-
     @pytest.fixture
     def task_data(self):
         """Sample task data for testing"""
-        return {
-            "task_id": 123,
-            "subtask_id": 456,
-            "task_title": "Test Task",
-            "subtask_title": "Test Subtask",
-            "prompt": "Hello Dify",
-            "bot_prompt": json.dumps({
-                "difyAppId": "app-test-123",
-                "params": {
-                    "customer_name": "John Doe",
-                    "language": "en-US"
-                }
-            }),
-            "bot": [{
-                "agent_config": {
-                    "env": {
-                        "DIFY_API_KEY": "app-test-api-key",
-                        "DIFY_BASE_URL": "https://api.dify.ai",
-                        "DIFY_APP_ID": "app-default-123"
-                    }
-                }
-            }],
-            "user": {
-                "user_name": "testuser"
-            }
-        }
+        return _sample_task_data()
+
+    @pytest.fixture(scope="class")
+    def dify_agent(self):
+        """DifyAgent built once for the tests that only read from it"""
+        return DifyAgent(_sample_task_data())
 
     def test_init(self, task_data):
         """Test DifyAgent initialization"""
@@ -87,38 +72,30 @@ class TestDifyAgent:
         assert agent.dify_app_id == "app-default-123"  # Should use default from config
         assert agent.params == {}
 
-    def test_parse_bot_prompt_valid(self, task_data):
+    def test_parse_bot_prompt_valid(self, dify_agent, task_data):
         """Test parsing valid bot_prompt"""
-        agent = DifyAgent(task_data)
-
-        app_id, params = agent._parse_bot_prompt(task_data["bot_prompt"])
+        app_id, params = dify_agent._parse_bot_prompt(task_data["bot_prompt"])
 
         assert app_id == "app-test-123"
         assert params == {"customer_name": "John Doe", "language": "en-US"}
 
-    def test_parse_bot_prompt_invalid_json(self, task_data):
+    def test_parse_bot_prompt_invalid_json(self, dify_agent):
         """Test parsing invalid JSON bot_prompt"""
-        agent = DifyAgent(task_data)
-
-        app_id, params = agent._parse_bot_prompt("invalid json")
+        app_id, params = dify_agent._parse_bot_prompt("invalid json")
 
         assert app_id is None
         assert params == {}
 
-    def test_parse_bot_prompt_empty(self, task_data):
+    def test_parse_bot_prompt_empty(self, dify_agent):
         """Test parsing empty bot_prompt"""
-        agent = DifyAgent(task_data)
-
-        app_id, params = agent._parse_bot_prompt("")
+        app_id, params = dify_agent._parse_bot_prompt("")
 
         assert app_id is None
         assert params == {}
 
-    def test_validate_config_success(self, task_data):
+    def test_validate_config_success(self, dify_agent):
         """Test config validation with valid config"""
-        agent = DifyAgent(task_data)
-
-        result = agent._validate_config()
+        result = dify_agent._validate_config()
 
         assert result is True
 
@@ -279,8 +256,6 @@ class TestDifyAgent:
         agent3 = DifyAgent(task_data)
         assert agent3.conversation_id == ""
 
-    def test_get_name(self, task_data):
+    def test_get_name(self, dify_agent):
         """Test get_name method"""
-        agent = DifyAgent(task_data)
-
-        assert agent.get_name() == "Dify"
+        assert dify_agent.get_name() == "Dify"
@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
-from unittest.mock import patch, MagicMock
 from executor.agents.factory import AgentFactory
 from executor.agents.claude_code.claude_code_agent import ClaudeCodeAgent
 from executor.agents.agno.agno_agent import AgnoAgent
@@ -13,33 +12,9 @@ from executor.agents.dify.dify_agent import DifyAgent
 class TestAgentFactory:
     """Test cases for AgentFactory"""
 
-    @pytest.fixture(autouse=True)
-    def mock_http_requests(self):
-        """
-        Mock all HTTP requests to prevent actual network calls during tests.
-        - requests.get: DifyAgent.__init__ calls _get_app_mode() which makes GET to /v1/info
-        - requests.post: CallbackClient.send_callback() makes POST to callback URL
-        """
-        with patch('executor.agents.dify.dify_agent.requests.get') as mock_get, \
-             patch('executor.callback.callback_client.requests.post') as mock_post:
-            # Mock GET response for _get_app_mode()
-            mock_get_response = MagicMock()
-            mock_get_response.status_code = 200
-            mock_get_response.json.return_value = {"mode": "chat"}
-            mock_get.return_value = mock_get_response
-
-            # Mock POST response for callback
-            mock_post_response = MagicMock()
-            mock_post_response.status_code = 200
-            mock_post_response.content = b'{}'
-            mock_post_response.json.return_value = {}
-            mock_post.return_value = mock_post_response
-
-            yield {"get": mock_get, "post": mock_post}
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def task_data(self):
-        """Sample task data for testing"""
+        """Sample task data for testing, shared read-only across the class"""
         return {
             "task_id": 123,
             "subtask_id": 456,
@@ -54,60 +29,29 @@ class TestAgentFactory:
             }]
         }
 
-    def test_get_claudecode_agent(self, task_data):
-        """Test creating ClaudeCode agent"""
-        agent = AgentFactory.get_agent("claudecode", task_data)
-
-        assert agent is not None
-        assert isinstance(agent, ClaudeCodeAgent)
-        assert agent.task_id == task_data["task_id"]
-
-    def test_get_claudecode_agent_case_insensitive(self, task_data):
-        """Test creating ClaudeCode agent with different case"""
-        agent = AgentFactory.get_agent("ClaudeCode", task_data)
-
-        assert agent is not None
-        assert isinstance(agent, ClaudeCodeAgent)
-
-    def test_get_agno_agent(self, task_data):
-        """Test creating Agno agent"""
-        agent = AgentFactory.get_agent("agno", task_data)
-
-        assert agent is not None
-        assert isinstance(agent, AgnoAgent)
-        assert agent.task_id == task_data["task_id"]
-
-    def test_get_agno_agent_case_insensitive(self, task_data):
-        """Test creating Agno agent with different case"""
-        agent = AgentFactory.get_agent("AGNO", task_data)
-
-        assert agent is not None
-        assert isinstance(agent, AgnoAgent)
-
-    def test_get_dify_agent(self, task_data):
-        """Test creating Dify agent"""
-        agent = AgentFactory.get_agent("dify", task_data)
+    @pytest.mark.parametrize(
+        "agent_type,expected_class",
+        [
+            ("claudecode", ClaudeCodeAgent),
+            ("ClaudeCode", ClaudeCodeAgent),
+            ("agno", AgnoAgent),
+            ("AGNO", AgnoAgent),
+            ("dify", DifyAgent),
+            ("DIFY", DifyAgent),
+        ],
+    )
+    def test_get_agent(self, agent_type, expected_class, task_data):
+        """Test creating each supported agent, case-insensitively"""
+        agent = AgentFactory.get_agent(agent_type, task_data)
 
         assert agent is not None
-        assert isinstance(agent, DifyAgent)
+        assert isinstance(agent, expected_class)
         assert agent.task_id == task_data["task_id"]
 
-    def test_get_dify_agent_case_insensitive(self, task_data):
-        """Test creating Dify agent with different case"""
-        agent = AgentFactory.get_agent("DIFY", task_data)
-
-        assert agent is not None
-        assert isinstance(agent, DifyAgent)
-
-    def test_get_unsupported_agent(self, task_data):
-        """Test creating unsupported agent type"""
-        agent = AgentFactory.get_agent("unsupported_type", task_data)
-
-        assert agent is None
-
-    def test_get_empty_agent_type(self, task_data):
-        """Test creating agent with empty type"""
-        agent = AgentFactory.get_agent("", task_data)
+    @pytest.mark.parametrize("agent_type", ["unsupported_type", ""])
+    def test_get_unsupported_agent(self, agent_type, task_data):
+        """Test creating unsupported or empty agent type"""
+        agent = AgentFactory.get_agent(agent_type, task_data)
 
         assert agent is None
 
@@ -119,3 +63,16 @@ class TestAgentFactory:
         assert AgentFactory._agents["claudecode"] == ClaudeCodeAgent
         assert AgentFactory._agents["agno"] == AgnoAgent
         assert AgentFactory._agents["dify"] == DifyAgent
+
+    def test_is_external_api_agent(self):
+        """Test external API classification of registered agents"""
+        assert AgentFactory.is_external_api_agent("dify") is True
+        assert AgentFactory.is_external_api_agent("DIFY") is True
+        assert AgentFactory.is_external_api_agent("claudecode") is False
+        assert AgentFactory.is_external_api_agent("unsupported_type") is False
+
+    def test_get_agent_type(self):
+        """Test agent type classification lookup"""
+        assert AgentFactory.get_agent_type("Dify") == DifyAgent.AGENT_TYPE
+        assert AgentFactory.get_agent_type("claudecode") == "local_engine"
+        assert AgentFactory.get_agent_type("unsupported_type") is None
@@ -13,6 +13,9 @@ from shared.logger import setup_logger
 
 logger = setup_logger("mcp_utils")
 
+# Pattern to match ${{path.to.value}}
+_PLACEHOLDER_RE = re.compile(r"\$\{\{([^}]+)\}\}")
+
 
 def extract_mcp_servers_config(config: Dict[str, Any]) -> Optional[Any]:
     """
@@ -162,8 +165,6 @@ def _replace_placeholders_in_string(text: str, task_data: Dict[str, Any]) -> str
         >>> _replace_placeholders_in_string("${{user.email}}", task_data)
         '${{user.email}}'
     """
-    # Pattern to match ${{path.to.value}}
-    pattern = r"\$\{\{([^}]+)\}\}"
 
     def replace_match(match: re.Match) -> str:
         path = match.group(1).strip()
@@ -175,7 +176,7 @@ def _replace_placeholders_in_string(text: str, task_data: Dict[str, Any]) -> str
             # Keep original placeholder if path not found
             return match.group(0)
 
-    return re.sub(pattern, replace_match, text)
+    return _PLACEHOLDER_RE.sub(replace_match, text)
 
 
 def _replace_variables_recursive(